@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple
 
 from tach import errors
 from tach import filesystem as fs
@@ -13,35 +14,44 @@ from tach.extension import get_project_imports, set_excluded_paths
 from tach.parsing import build_module_tree
 
 if TYPE_CHECKING:
+    from concurrent.futures import Future
+
     from tach.core import ModuleNode, ModuleTree, ProjectConfig
 
 
-@dataclass
-class ErrorInfo:
+class ErrorInfo(NamedTuple):
+    # Created once per error and never modified, so a tuple avoids a per-instance __dict__
     source_module: str = ""
     invalid_module: str = ""
-    allowed_modules: list[str] = field(default_factory=list)
+    allowed_modules: tuple[str, ...] = ()
     exception_message: str = ""
 
     @property
     def is_dependency_error(self) -> bool:
-        return all((self.source_module, self.invalid_module))
+        # Checked for every reported error, so skip building a tuple for all()
+        return bool(self.source_module and self.invalid_module)
 
 
 def is_top_level_module_import(mod_path: str, module: ModuleNode) -> bool:
     return mod_path == module.full_path
 
 
+def is_within_module_path(mod_path: str, module_path: str) -> bool:
+    # Equivalent to 'mod_path == module_path or mod_path.startswith(module_path + ".")'
+    # without building the prefix string
+    return mod_path.startswith(module_path) and (
+        len(mod_path) == len(module_path) or mod_path[len(module_path)] == "."
+    )
+
+
 def import_matches_interface_members(mod_path: str, module: ModuleNode) -> bool:
-    mod_path_segments = mod_path.rsplit(".", 1)
-    if len(mod_path_segments) == 1:
-        return mod_path_segments[0] == module.full_path
-    else:
-        mod_pkg_path, mod_member_name = mod_path_segments
-        return (
-            mod_pkg_path == module.full_path
-            and mod_member_name in module.interface_members
-        )
+    # rpartition splits on the last '.' without allocating a list
+    mod_pkg_path, separator, mod_member_name = mod_path.rpartition(".")
+    if not separator:
+        return mod_path == module.full_path
+    return (
+        mod_pkg_path == module.full_path and mod_member_name in module.interface_members
+    )
 
 
 def check_import(
@@ -50,6 +60,15 @@ def check_import(
     file_mod_path: str,
     file_nearest_module: ModuleNode | None = None,
 ) -> ErrorInfo | None:
+    if (
+        file_nearest_module is not None
+        and not file_nearest_module.children
+        and is_within_module_path(import_mod_path, file_nearest_module.full_path)
+    ):
+        # Fast path: with no modules nested beneath the file's module,
+        # any import under its path must resolve to the same module
+        return None
+
     import_nearest_module = module_tree.find_nearest(import_mod_path)
     if import_nearest_module is None:
         # This shouldn't happen since we intend to filter out any external imports,
@@ -66,8 +85,10 @@ def check_import(
             exception_message=f"Module containing '{file_mod_path}' not found in project.",
         )
 
-    # Imports within the same module are always allowed
-    if import_nearest_module == file_nearest_module:
+    # Imports within the same module are always allowed.
+    # Each module has exactly one node in the tree, so compare identity rather than
+    # falling back to dataclass equality, which compares fields one by one.
+    if import_nearest_module is file_nearest_module:
         return None
 
     import_module_config = import_nearest_module.config
@@ -96,24 +117,26 @@ def check_import(
     file_nearest_module_path = file_nearest_module.config.path
     import_nearest_module_path = import_nearest_module.config.path
 
-    # The import must be explicitly allowed
+    # The import must be explicitly allowed.
+    # Module paths are interned, so list containment mostly compares by identity.
     dependency_tags = file_nearest_module.config.depends_on
-    if any(
-        dependency_tag == import_nearest_module_path
-        for dependency_tag in dependency_tags
-    ):
+    if import_nearest_module_path in dependency_tags:
         # The import matches at least one expected dependency
         return None
     # This means the import is not declared as a dependency of the file
     return ErrorInfo(
         source_module=file_nearest_module_path,
         invalid_module=import_nearest_module_path,
-        allowed_modules=dependency_tags,
+        allowed_modules=tuple(dependency_tags),
     )
 
 
 @dataclass
 class BoundaryError:
+    # One of these is created for every reported import, so skip the per-instance __dict__.
+    # Declared by hand since dataclass(slots=True) requires Python 3.10.
+    __slots__ = ("file_path", "line_number", "import_mod_path", "error_info")
+
     file_path: Path
     line_number: int
     import_mod_path: str
@@ -147,13 +170,70 @@ def validate_project_modules(
     return result
 
 
-def is_path_excluded(path: Path, exclude_paths: list[str]) -> bool:
+# Flags every pattern has when it sets no inline global flags of its own
+DEFAULT_REGEX_FLAGS = re.compile("").flags
+
+
+@dataclass
+class ExcludePatterns:
+    # Patterns without regex metacharacters only ever match as a plain prefix
+    literal_prefixes: tuple[str, ...] = ()
+    # Patterns without groups or inline global flags, combined into one alternation
+    # so that each path is matched in a single pass
+    combined_regex: re.Pattern[str] | None = None
+    # Patterns which would change meaning inside an alternation, matched one by one
+    regexes: tuple[re.Pattern[str], ...] = ()
+
+
+def compile_exclude_patterns(exclude_paths: list[str]) -> ExcludePatterns:
+    literal_prefixes: list[str] = []
+    combinable_patterns: list[str] = []
+    regexes: list[re.Pattern[str]] = []
+    for exclude_path in exclude_paths:
+        if re.escape(exclude_path) == exclude_path:
+            literal_prefixes.append(exclude_path)
+            continue
+
+        regex = re.compile(exclude_path)
+        # Inline global flags must come first in an expression,
+        # and group names and numbers (and so backreferences) would clash
+        # with those of other patterns, so only combine patterns free of both
+        if regex.groups == 0 and regex.flags == DEFAULT_REGEX_FLAGS:
+            combinable_patterns.append(f"(?:{exclude_path})")
+        else:
+            regexes.append(regex)
+
+    return ExcludePatterns(
+        literal_prefixes=tuple(literal_prefixes),
+        combined_regex=re.compile("|".join(combinable_patterns))
+        if combinable_patterns
+        else None,
+        regexes=tuple(regexes),
+    )
+
+
+def is_path_excluded(path: Path, exclude_patterns: ExcludePatterns) -> bool:
     dirpath_for_matching = f"{path}/"
+    # A single startswith call covers every literal pattern
+    if dirpath_for_matching.startswith(exclude_patterns.literal_prefixes):
+        return True
+    combined_regex = exclude_patterns.combined_regex
+    if combined_regex is not None and combined_regex.match(dirpath_for_matching):
+        return True
     return any(
-        re.match(exclude_path, dirpath_for_matching) for exclude_path in exclude_paths
+        exclude_pattern.match(dirpath_for_matching)
+        for exclude_pattern in exclude_patterns.regexes
     )
 
 
+def is_dir_excluded(dirpath: Path, exclude_patterns: ExcludePatterns) -> bool:
+    # Exclude patterns apply to file paths. A literal prefix which matches a directory
+    # also matches every file beneath it, so the whole directory can be skipped.
+    # A regex (e.g. one ending in '$') may match a directory but none of its files,
+    # so regex patterns are left to the per-file check.
+    return f"{dirpath}/".startswith(exclude_patterns.literal_prefixes)
+
+
 def check(
     project_root: Path,
     project_config: ProjectConfig,
@@ -168,7 +248,9 @@ def check(
     warnings: list[str] = []
 
     if exclude_paths is not None and project_config.exclude is not None:
-        exclude_paths.extend(project_config.exclude)
+        # Build a new list rather than extending the caller's,
+        # since the same list may be passed to check more than once
+        exclude_paths = [*exclude_paths, *project_config.exclude]
     else:
         exclude_paths = project_config.exclude
 
@@ -190,48 +272,81 @@ def check(
     # This informs the Rust extension ahead-of-time which paths are excluded.
     # The extension builds regexes and uses them during `get_project_imports`
     set_excluded_paths(exclude_paths=exclude_paths or [])
-    for file_path in fs.walk_pyfiles(source_root):
-        abs_file_path = source_root / file_path
-        rel_file_path = abs_file_path.relative_to(project_root)
-        if is_path_excluded(rel_file_path, exclude_paths=exclude_paths or []):
-            continue
+    # Similarly, compile the patterns once here rather than for each file.
+    # Literal patterns share one startswith check, and regex patterns are joined
+    # into one alternation only when that cannot change their meaning;
+    # the rest are still matched one by one.
+    exclude_patterns = compile_exclude_patterns(exclude_paths or [])
+    # Resolve the source root against the project root once,
+    # rather than making every walked file relative to the project root
+    rel_source_root = source_root.relative_to(project_root)
+    # The extension releases the GIL while reading and parsing a file,
+    # so each file is submitted as soon as the walk finds it, and imports are
+    # gathered concurrently while the rest of the tree is still being walked.
+    # Results are still consumed in walk order to keep the output stable.
+    files_to_check: list[
+        tuple[Path, str, ModuleNode, Future[list[tuple[str, int]]]]
+    ] = []
+    with ThreadPoolExecutor() as executor:
+        for file_path in fs.walk_pyfiles(
+            source_root,
+            # Prune excluded directories during the walk rather than filtering each file
+            exclude_dir=lambda rel_dirpath: is_dir_excluded(
+                rel_source_root / rel_dirpath, exclude_patterns=exclude_patterns
+            ),
+        ):
+            rel_file_path = rel_source_root / file_path
+            if is_path_excluded(rel_file_path, exclude_patterns=exclude_patterns):
+                continue
 
-        mod_path = fs.file_to_module_path(
-            source_root=source_root, file_path=abs_file_path
-        )
-        nearest_module = module_tree.find_nearest(mod_path)
-        if nearest_module is None:
-            continue
+            # The walk already yields paths relative to the source root
+            mod_path = fs.relative_file_to_module_path(str(file_path))
+            nearest_module = module_tree.find_nearest(mod_path)
+            if nearest_module is None:
+                continue
 
-        try:
-            project_imports = get_project_imports(
+            import_future = executor.submit(
+                get_project_imports,
                 project_root=str(project_root),
                 source_root=str(project_config.source_root),
-                file_path=str(abs_file_path),
+                file_path=str(source_root / file_path),
                 ignore_type_checking_imports=project_config.ignore_type_checking_imports,
             )
+            files_to_check.append((file_path, mod_path, nearest_module, import_future))
+
+    # Files in the same module tend to import the same paths, and the result
+    # depends only on the file's module and the import path, so check each pair once.
+    # Every occurrence still reports its own error with its own line number.
+    check_errors_by_import: dict[tuple[str, str], ErrorInfo | None] = {}
+    for file_path, mod_path, nearest_module, import_future in files_to_check:
+        try:
+            project_imports = import_future.result()
         except SyntaxError:
             warnings.append(f"Skipping '{file_path}' due to a syntax error.")
             continue
         except OSError:
             warnings.append(f"Skipping '{file_path}' due to a file system error.")
             continue
-        for project_import in project_imports:
+        for import_mod_path, line_number in project_imports:
             found_at_least_one_project_import = True
-            check_error = check_import(
-                module_tree=module_tree,
-                import_mod_path=project_import[0],
-                file_nearest_module=nearest_module,
-                file_mod_path=mod_path,
-            )
+            check_key = (nearest_module.full_path, import_mod_path)
+            if check_key in check_errors_by_import:
+                check_error = check_errors_by_import[check_key]
+            else:
+                check_error = check_errors_by_import[check_key] = check_import(
+                    module_tree=module_tree,
+                    import_mod_path=import_mod_path,
+                    file_nearest_module=nearest_module,
+                    file_mod_path=mod_path,
+                )
             if check_error is None:
                 continue
 
             boundary_errors.append(
                 BoundaryError(
                     file_path=file_path,
-                    import_mod_path=project_import[0],
-                    line_number=project_import[1],
+                    import_mod_path=import_mod_path,
+                    line_number=line_number,
                     error_info=check_error,
                 )
             )
@@ -17,10 +17,7 @@ from tach.core import ProjectConfig
 from tach.errors import TachError
 from tach.filesystem import install_pre_commit
 from tach.logging import LogDataModel, logger
-from tach.mod import mod_edit_interactive
 from tach.parsing import parse_project_config
-from tach.report import report
-from tach.show import generate_show_url
 from tach.sync import prune_dependency_constraints, sync_project
 
 if TYPE_CHECKING:
@@ -42,11 +39,18 @@ def detect_environment() -> TerminalEnvironment:
     return TerminalEnvironment.UNKNOWN
 
 
+@lru_cache(maxsize=1024)
+def resolve_path(path: Path) -> Path:
+    # Errors tend to cluster in a handful of files,
+    # so avoid resolving the same path over and over
+    return path.resolve()
+
+
 def create_clickable_link(
     file_path: Path, display_path: Path | None = None, line: int | None = None
 ) -> str:
     terminal_env = detect_environment()
-    abs_path = file_path.resolve()
+    abs_path = resolve_path(file_path)
 
     if terminal_env == TerminalEnvironment.JETBRAINS:
         link = f"file://{abs_path}:{line}" if line is not None else f"file://{abs_path}"
@@ -99,12 +103,21 @@ def print_warnings(warning_list: list[str]) -> None:
 def print_errors(error_list: list[BoundaryError], source_root: Path) -> None:
     if not error_list:
         return
-    sorted_results = sorted(error_list, key=lambda e: e.file_path)
-    for error in sorted_results:
-        print(
-            build_error_message(error, source_root=source_root),
-            file=sys.stderr,
-        )
+    # check() reports errors grouped by file, so bucket them by file
+    # and only sort the distinct file paths.
+    # Errors within a file keep their order, just as with a stable sort.
+    errors_by_file: dict[Path, list[BoundaryError]] = {}
+    for error in error_list:
+        errors_by_file.setdefault(error.file_path, []).append(error)
+    # Write every error message at once rather than printing each one separately
+    print(
+        "\n".join(
+            build_error_message(error, source_root=source_root)
+            for file_path in sorted(errors_by_file)
+            for error in errors_by_file[file_path]
+        ),
+        file=sys.stderr,
+    )
     print(
         f"{BCOLORS.WARNING}\nIf you intended to add a new dependency, run 'tach sync' to update your module configuration."
         f"\nOtherwise, remove any disallowed imports and consider refactoring.\n{BCOLORS.ENDC}"
@@ -274,7 +287,8 @@ def tach_check(
             exit_code = 1
 
         # If we're checking in strict mode, we want to verify that pruning constraints has no effect
-        if exact:
+        # This requires another full check, which can be skipped if there are no dependencies to prune
+        if exact and any(module.depends_on for module in project_config.modules):
             pruned_config = prune_dependency_constraints(
                 project_root=project_root,
                 project_config=project_config,
@@ -305,6 +319,9 @@ def tach_mod(
             ),
         },
     )
+    # The interactive editor pulls in prompt_toolkit, so only load it for 'tach mod'
+    from tach.mod import mod_edit_interactive
+
     try:
         project_config = parse_project_config(root=project_root) or ProjectConfig()
         saved_changes, warnings = mod_edit_interactive(
@@ -408,6 +425,8 @@ def tach_report(project_root: Path, path: str, exclude_paths: list[str] | None =
             ),
         },
     )
+    from tach.report import report
+
     project_config = parse_project_config(root=project_root)
     if project_config is None:
         print_no_config_yml()
@@ -438,6 +457,8 @@ def tach_show(project_root: Path):
             ),
         },
     )
+    from tach.show import generate_show_url
+
     project_config = parse_project_config(root=project_root)
     if project_config is None:
         print_no_config_yml()
@@ -467,7 +488,17 @@ def main() -> None:
         )
 
     # TODO: rename throughout to 'exclude_patterns' to indicate that these are regex patterns
-    exclude_paths = args.exclude.split(",") if getattr(args, "exclude", None) else None
+    # Strip whitespace around each pattern and drop empty ones in the same pass,
+    # since an empty pattern would otherwise exclude every path
+    exclude_paths = (
+        [
+            exclude_path.strip()
+            for exclude_path in args.exclude.split(",")
+            if exclude_path.strip()
+        ]
+        if getattr(args, "exclude", None)
+        else None
+    )
 
     if args.command == "mod":
         tach_mod(
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import sys
 from copy import copy
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Iterable
 
 from pydantic import AfterValidator, BaseModel, Field, field_serializer
 from typing_extensions import Annotated
@@ -14,6 +16,11 @@ class Config(BaseModel):
     model_config = {"extra": "forbid"}
 
 
+# Module paths are hashed and compared constantly while checking a project,
+# so intern them once when the configuration is loaded
+InternedStr = Annotated[str, AfterValidator(sys.intern)]
+
+
 class ModuleConfig(Config):
     """
     Configuration for a single module in a Tach project.
@@ -21,8 +28,8 @@ class ModuleConfig(Config):
     Primarily responsible for declaring dependencies.
     """
 
-    path: str
-    depends_on: list[str] = Field(default_factory=list)
+    path: InternedStr
+    depends_on: list[InternedStr] = Field(default_factory=list)
     strict: bool = False
 
     @property
@@ -100,6 +107,9 @@ class ProjectConfig(Config):
         )
 
     def add_dependency_to_module(self, module: str, dependency: str):
+        self.add_dependencies_to_module(module, [dependency])
+
+    def add_dependencies_to_module(self, module: str, dependencies: Iterable[str]):
         current_module_config = next(
             (
                 module_config
@@ -109,29 +119,42 @@ class ProjectConfig(Config):
             None,
         )
         if not current_module_config:
-            # No configuration exists for tag, add default config with this dependency
-            self.modules.append(ModuleConfig(path=module, depends_on=[dependency]))
-        else:
-            # Config already exists, set the union of existing dependencies and new ones
-            new_dependencies = set(current_module_config.depends_on) | {dependency}
-            current_module_config.depends_on = list(new_dependencies)
+            # No configuration exists for tag, add default config with these dependencies
+            self.modules.append(
+                ModuleConfig(path=module, depends_on=list(dependencies))
+            )
+            return
+
+        new_dependencies = [
+            dependency
+            for dependency in dependencies
+            if dependency not in current_module_config.depends_on
+        ]
+        if new_dependencies:
+            # Config already exists, add any dependencies which are not yet declared
+            # NOTE: assigning (rather than appending) marks 'depends_on' as set for serialization
+            current_module_config.depends_on = [
+                *current_module_config.depends_on,
+                *new_dependencies,
+            ]
 
     def compare_dependencies(
         self, other_config: ProjectConfig
     ) -> list[UnusedDependencies]:
         all_unused_dependencies: list[UnusedDependencies] = []
-        own_module_paths = set(module.path for module in self.modules)
+        # Index our own dependencies up front to avoid a scan over all modules for each module
+        own_dependencies_by_path = {
+            module.path: set(module.depends_on) for module in self.modules
+        }
         for module_config in other_config.modules:
-            if module_config.path not in own_module_paths:
+            if module_config.path not in own_dependencies_by_path:
                 all_unused_dependencies.append(
                     UnusedDependencies(
                         path=module_config.path, dependencies=module_config.depends_on
                     )
                 )
                 continue
-            own_module_dependencies = set(
-                self.dependencies_for_module(module=module_config.path)
-            )
+            own_module_dependencies = own_dependencies_by_path[module_config.path]
             extra_dependencies = set(module_config.depends_on) - own_module_dependencies
             if extra_dependencies:
                 all_unused_dependencies.append(
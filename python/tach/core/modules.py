@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from collections import deque
+import sys
 from dataclasses import dataclass, field
-from typing import Generator
+from functools import lru_cache
+from typing import Generator, Iterable
 
 from tach.core.config import ModuleConfig, RootModuleConfig
 
@@ -22,7 +23,8 @@ class ModuleNode:
     is_end_of_path: bool
     full_path: str
     config: ModuleConfig | None
-    interface_members: list[str] = field(default_factory=list)
+    # Imports are checked against these members one at a time, so store a set
+    interface_members: frozenset[str] = field(default_factory=frozenset)
     children: dict[str, ModuleNode] = field(default_factory=dict)
 
     @classmethod
@@ -35,18 +37,20 @@ class ModuleNode:
         return ModuleNode(is_end_of_path=True, full_path=".", config=config)
 
     def fill(
-        self, config: ModuleConfig, full_path: str, interface_members: list[str]
+        self, config: ModuleConfig, full_path: str, interface_members: Iterable[str]
     ) -> None:
         self.is_end_of_path = True
         self.config = config
         self.full_path = full_path
-        self.interface_members = interface_members
+        self.interface_members = frozenset(interface_members)
 
 
-def split_module_path(path: str) -> list[str]:
+@lru_cache(maxsize=4096)
+def split_module_path(path: str) -> tuple[str, ...]:
+    # The same module paths are looked up repeatedly while checking a project
     if not path or path == ".":
-        return []
-    return path.split(".")
+        return ()
+    return tuple(path.split("."))
 
 
 @dataclass
@@ -57,25 +61,36 @@ class ModuleTree:
     """
 
     root: ModuleNode = field(default_factory=ModuleNode.implicit_root)
+    # Flat index of module path -> node, built lazily from the tree for lookups
+    _index: dict[str, ModuleNode] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # The same import paths appear across many files, so remember each result
+    _nearest_cache: dict[str, ModuleNode] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     def __iter__(self):
         return module_tree_iterator(self)
 
+    def _build_index(self) -> dict[str, ModuleNode]:
+        # Key on each module's own (interned) full path,
+        # rather than building new path strings while walking the tree
+        return {node.full_path: node for node in self}
+
+    @property
+    def index(self) -> dict[str, ModuleNode]:
+        if self._index is None:
+            self._index = self._build_index()
+        return self._index
+
     def get(self, path: str) -> ModuleNode | None:
         if not path:
             return None
 
-        node = self.root
-        parts = split_module_path(path)
-
-        for part in parts:
-            if part not in node.children:
-                return None
-            node = node.children[part]
+        return self.index.get(path)
 
-        return node if node.is_end_of_path else None
-
-    def insert(self, config: ModuleConfig, path: str, interface_members: list[str]):
+    def insert(self, config: ModuleConfig, path: str, interface_members: Iterable[str]):
         if not path:
             raise ValueError("Cannot insert module with empty path.")
 
@@ -83,33 +98,45 @@ class ModuleTree:
         parts = split_module_path(path)
 
         for part in parts:
-            if part not in node.children:
-                node.children[part] = ModuleNode.empty()
-            node = node.children[part]
+            child = node.children.get(part)
+            if child is None:
+                child = node.children[part] = ModuleNode.empty()
+            node = child
 
-        node.fill(config, path, interface_members)
+        node.fill(config, sys.intern(path), interface_members)
+        self._index = None
+        self._nearest_cache.clear()
 
     def find_nearest(self, path: str) -> ModuleNode | None:
-        node = self.root
-        parts = split_module_path(path)
-        nearest_parent = node
-
-        for part in parts:
-            if part in node.children:
-                node = node.children[part]
-                if node.is_end_of_path:
-                    nearest_parent = node
-            else:
+        nearest = self._nearest_cache.get(path)
+        if nearest is not None:
+            return nearest
+
+        # Try the longest module path prefix first, since most lookups
+        # hit on the full path or its immediate parent
+        index = self.index
+        prefix = path
+        while prefix:
+            nearest = index.get(prefix)
+            if nearest is not None:
                 break
+            prefix = prefix.rpartition(".")[0]
+        else:
+            if not self.root.is_end_of_path:
+                return None
+            nearest = self.root
 
-        return nearest_parent if nearest_parent.is_end_of_path else None
+        self._nearest_cache[path] = nearest
+        return nearest
 
 
 def module_tree_iterator(tree: ModuleTree) -> Generator[ModuleNode, None, None]:
-    stack = deque([tree.root])
+    # Callers only need every module, not any particular order,
+    # so walk depth-first with a plain list as the stack
+    stack = [tree.root]
 
     while stack:
-        node = stack.popleft()
+        node = stack.pop()
         if node.is_end_of_path:
             yield node
 
@@ -12,6 +12,7 @@ from tach.filesystem.service import (
     module_to_pyfile_or_dir_path,
     parse_ast,
     read_file,
+    relative_file_to_module_path,
     walk,
     walk_pyfiles,
     write_file,
@@ -28,6 +29,7 @@ __all__ = [
     "walk",
     "walk_pyfiles",
     "file_to_module_path",
+    "relative_file_to_module_path",
     "module_to_file_path_no_members",
     "module_to_pyfile_or_dir_path",
     "get_project_config_path",
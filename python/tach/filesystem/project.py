@@ -4,15 +4,16 @@ from pathlib import Path
 
 from tach.constants import CONFIG_FILE_NAME
 
+# Accepted config file names, in order of precedence
+PROJECT_CONFIG_FILE_NAMES = (f"{CONFIG_FILE_NAME}.yml", f"{CONFIG_FILE_NAME}.yaml")
+
 
 def get_project_config_path(root: Path | None = None) -> Path | None:
     root = root or Path.cwd()
-    file_path = root / f"{CONFIG_FILE_NAME}.yml"
-    if file_path.exists():
-        return file_path
-    file_path = root / f"{CONFIG_FILE_NAME}.yaml"
-    if file_path.exists():
-        return file_path
+    for file_name in PROJECT_CONFIG_FILE_NAMES:
+        file_path = root / file_name
+        if file_path.exists():
+            return file_path
     return None
 
 
@@ -8,7 +8,7 @@ from collections import defaultdict
 from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
-from typing import Generator
+from typing import Callable, Generator
 
 from tach import errors
 from tach.colors import BCOLORS
@@ -87,7 +87,7 @@ def canonical(path: str) -> str:
 
 def read_file(path: str) -> str:
     cached_file = _cached_file(path)
-    if cached_file and cached_file.content:
+    if cached_file and cached_file.content is not None:
         return cached_file.content
 
     with open(path) as f:
@@ -129,29 +129,19 @@ def mark_executable(path: str):
 
 def parse_ast(path: str) -> ast.AST:
     cached_file = _cached_file(path)
-    if cached_file and cached_file.ast:
+    if cached_file and cached_file.ast is not None:
         return cached_file.ast
 
-    if cached_file and cached_file.content:
-        content = cached_file.content
-        try:
-            ast_result = ast.parse(cached_file.content)
-        except SyntaxError as e:
-            raise errors.TachParseError(f"Syntax error in {path}: {e}")
-    else:
-        with open(path) as f:
-            content = f.read()
-        try:
-            ast_result = ast.parse(content)
-        except SyntaxError as e:
-            raise errors.TachParseError(f"Syntax error in {path}: {e}")
+    # Share the file content cache with 'read_file' so each file is read at most once
+    content = read_file(path)
+    try:
+        ast_result = ast.parse(content)
+    except SyntaxError as e:
+        raise errors.TachParseError(f"Syntax error in {path}: {e}")
 
+    cached_file = _cached_file(path)
     if cached_file:
-        cached_file.content = content
         cached_file.ast = ast_result
-    else:
-        _set_cached_file(path, FileInfo(path=path, content=content, ast=ast_result))
-
     return ast_result
 
 
@@ -181,30 +171,68 @@ def walk(
         yield rel_dirpath, list(map(Path, filter(filter_filename, filenames)))
 
 
-def walk_pyfiles(root: Path, depth: int | None = None) -> Generator[Path, None, None]:
-    for dirpath, filepaths in walk(root, depth=depth):
-        for filepath in filepaths:
-            if filepath.name.endswith(".py"):
-                yield dirpath / filepath
+def walk_pyfiles(
+    root: Path,
+    depth: int | None = None,
+    exclude_dir: Callable[[str], bool] | None = None,
+) -> Generator[Path, None, None]:
+    """
+    Yield the paths of Python files under 'root', relative to 'root'.
+
+    If 'exclude_dir' is given, it receives each directory's path relative to 'root',
+    and directories for which it returns True are not descended into.
+    """
+    if depth is not None and depth <= 0:
+        return
+    # Walk with os.scandir directly rather than through 'walk',
+    # which avoids building Path objects for every directory and non-Python file.
+    # Relative directory paths are carried as prefixes ending in a separator,
+    # so each entry's relative path is a plain concatenation.
+    stack: list[tuple[str, str, int]] = [(str(root.resolve()), "", 0)]
+    while stack:
+        dirpath, rel_dir_prefix, current_depth = stack.pop()
+        try:
+            with os.scandir(dirpath) as scanner:
+                entries = list(scanner)
+        except OSError:
+            continue
+
+        for entry in entries:
+            if entry.name.startswith("."):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                if depth and current_depth > depth:
+                    continue
+                rel_entry_path = rel_dir_prefix + entry.name
+                if exclude_dir is not None and exclude_dir(rel_entry_path):
+                    continue
+                stack.append((entry.path, rel_entry_path + os.sep, current_depth + 1))
+            elif entry.name.endswith(".py") and not entry.is_dir():
+                yield Path(rel_dir_prefix + entry.name)
+
 
+PACKAGE_INIT_SUFFIX = f"{os.sep}__init__.py"
 
-@lru_cache(maxsize=None)
-def file_to_module_path(source_root: Path, file_path: Path) -> str:
-    # Assuming that the file_path has been 'canonicalized' and does not traverse multiple directories
-    file_path = file_path.relative_to(source_root)
-    if file_path == Path("."):
+
+def relative_file_to_module_path(file_path: str) -> str:
+    # Translates a file path which is already relative to the source root,
+    # using only string operations
+    if file_path == "." or file_path == "__init__.py":
         return ""
 
-    module_path = str(file_path).replace(os.sep, ".")
+    # Strip the file suffix with a single slice before translating separators
+    if file_path.endswith(PACKAGE_INIT_SUFFIX):
+        file_path = file_path[: -len(PACKAGE_INIT_SUFFIX)]
+    elif file_path.endswith(".py"):
+        file_path = file_path[:-3]
+
+    return file_path.replace(os.sep, ".")
 
-    if module_path.endswith(".py"):
-        module_path = module_path[:-3]
-    if module_path.endswith(".__init__"):
-        module_path = module_path[:-9]
-    if module_path == "__init__":
-        return ""
 
-    return module_path
+@lru_cache(maxsize=None)
+def file_to_module_path(source_root: Path, file_path: Path) -> str:
+    # Assuming that the file_path has been 'canonicalized' and does not traverse multiple directories
+    return relative_file_to_module_path(str(file_path.relative_to(source_root)))
 
 
 @lru_cache(maxsize=None)
@@ -214,7 +242,7 @@ def module_to_file_path_no_members(source_root: Path, module_path: str) -> Path
     into a Python file path or a Python package __init__.py
     """
     if module_path == ROOT_MODULE_SENTINEL_TAG:
-        root_path = Path("__init__.py")
+        root_path = source_root / "__init__.py"
         if root_path.exists():
             return root_path
         return None
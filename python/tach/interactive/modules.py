@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 import re
 from collections import deque
 from dataclasses import dataclass, field
@@ -127,8 +128,17 @@ class FileTree:
         root.is_source_root = True
         tree = cls(root=root, source_root=root)
         tree.nodes[str(path)] = root
+        # Compile the exclude patterns once for the whole tree,
+        # rather than looking them up in the 're' cache for every entry
+        exclude_patterns = (
+            [re.compile(exclude_path) for exclude_path in exclude_paths]
+            if exclude_paths is not None
+            else None
+        )
         tree._build_subtree(
-            root, depth=depth if depth is not None else 1, exclude_paths=exclude_paths
+            root,
+            depth=depth if depth is not None else 1,
+            exclude_patterns=exclude_patterns,
         )
         return tree
 
@@ -136,15 +146,20 @@ class FileTree:
         self,
         root: FileNode,
         depth: int = 1,
-        exclude_paths: list[str] | None = None,
+        exclude_patterns: list[re.Pattern[str]] | None = None,
     ):
         if root.is_dir:
             try:
-                for entry in root.full_path.iterdir():
+                # Scan with os.scandir, since each DirEntry caches its file type
+                # from the directory listing rather than calling stat
+                with os.scandir(root.full_path) as scanner:
+                    dir_entries = list(scanner)
+                for dir_entry in dir_entries:
+                    entry = Path(dir_entry.path)
                     if entry.name.startswith("."):
                         # Ignore hidden files and directories
                         continue
-                    if entry.is_file() and not entry.name.endswith(".py"):
+                    if dir_entry.is_file() and not entry.name.endswith(".py"):
                         # Only interested in Python files
                         continue
 
@@ -157,13 +172,13 @@ class FileTree:
                     entry_path_for_matching = (
                         f"{entry.relative_to(self.root.full_path)}/"
                     )
-                    if exclude_paths is not None and any(
-                        re.match(exclude_path, entry_path_for_matching)
-                        for exclude_path in exclude_paths
+                    if exclude_patterns is not None and any(
+                        exclude_pattern.match(entry_path_for_matching)
+                        for exclude_pattern in exclude_patterns
                     ):
                         # This path is ignored
                         continue
-                    child_node = FileNode.build_from_path(entry)
+                    child_node = FileNode(full_path=entry, is_dir=dir_entry.is_dir())
                     if depth > 1:
                         child_node.expanded = True
                     child_node.parent = root
@@ -173,10 +188,10 @@ class FileTree:
                         self._build_subtree(
                             child_node,
                             depth=max(depth - 1, 0),
-                            exclude_paths=exclude_paths,
+                            exclude_patterns=exclude_patterns,
                         )
             except PermissionError:
-                # This is expected to occur during iterdir when the directory cannot be accessed
+                # This is expected to occur during scandir when the directory cannot be accessed
                 # We simply bail if that happens, meaning it won't show up in the interactive viewer
                 return
 
@@ -15,32 +15,37 @@ PUBLIC_ANON_CLIENT_KEY = (
 )
 
 
-def log_request(url: str, data: dict[str, Any]) -> None:
+def log_requests(requests: list[tuple[str, dict[str, Any]]]) -> None:
     headers = {
         "Content-Type": "application/json",
         "apikey": PUBLIC_ANON_CLIENT_KEY,
         "authorization": f"Bearer {PUBLIC_ANON_CLIENT_KEY}",
     }
-    json_data = json.dumps(data)
-    full_url = f"{LOGGING_URL}/{url}"
-    conn = None
+    url_parts: parse.ParseResult = parse.urlparse(LOGGING_URL)
+    # All requests go to the same host, so share one connection (and TLS handshake)
+    conn = HTTPSConnection(url_parts.netloc, timeout=1)
     try:
-        url_parts: parse.ParseResult = parse.urlparse(full_url)
-        conn = HTTPSConnection(url_parts.netloc, timeout=1)
-        conn.request("POST", full_url, body=json_data, headers=headers)
-        conn.getresponse()
-    except Exception:  # noqa
-        pass
+        for url, data in requests:
+            # Each request is sent independently, so one failing does not drop the rest
+            try:
+                json_data = json.dumps(data)
+                full_url = f"{LOGGING_URL}/{url}"
+                conn.request("POST", full_url, body=json_data, headers=headers)
+                # The response must be fully read before the connection can be reused
+                conn.getresponse().read()
+            except Exception:  # noqa
+                # Drop the connection, since it may be mid-request;
+                # the next request reconnects automatically
+                conn.close()
     finally:
-        if conn is not None:
-            conn.close()
+        conn.close()
 
 
-def log_uid(uid: uuid.UUID, is_ci: bool, is_gauge: bool) -> None:
-    log_request(
-        url="rest/v1/User", data={"id": str(uid), "is_ci": is_ci, "is_gauge": is_gauge}
-    )
+def uid_request(
+    uid: uuid.UUID, is_ci: bool, is_gauge: bool
+) -> tuple[str, dict[str, Any]]:
+    return "rest/v1/User", {"id": str(uid), "is_ci": is_ci, "is_gauge": is_gauge}
 
 
-def log_record(record_data: dict[str, Any]) -> None:
-    log_request(url="rest/v1/LogRecord", data=record_data)
+def record_request(record_data: dict[str, Any]) -> tuple[str, dict[str, Any]]:
+    return "rest/v1/LogRecord", record_data
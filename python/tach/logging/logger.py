@@ -9,7 +9,8 @@ from typing import TYPE_CHECKING, Any
 from pydantic import BaseModel, Field
 
 from tach import __version__, cache
-from tach.logging.api import log_record, log_uid
+from tach.filesystem import find_project_config_root
+from tach.logging.api import log_requests, record_request, uid_request
 from tach.parsing import parse_project_config
 
 if TYPE_CHECKING:
@@ -36,9 +37,10 @@ def send_log_entry(record: logging.LogRecord, entry: str) -> None:
         "parameters": data.parameters if data else None,
         "version": version,
     }
+    requests = [record_request(record_data=log_data)]
     if uid is not None:
-        log_uid(uid=uid, is_ci=is_ci, is_gauge=is_gauge)
-    log_record(record_data=log_data)
+        requests.insert(0, uid_request(uid=uid, is_ci=is_ci, is_gauge=is_gauge))
+    log_requests(requests)
     cache.update_latest_version()
 
 
@@ -86,7 +88,7 @@ remote_handler = RemoteLoggingHandler()
 
 # Check if logging is enabled
 disable_logging = False
-project_config = parse_project_config()
+project_config = parse_project_config(root=find_project_config_root())
 if project_config:
     disable_logging = project_config.disable_logging
 if not disable_logging:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 
 import yaml
@@ -8,6 +9,13 @@ from tach import filesystem as fs
 from tach.constants import ROOT_MODULE_SENTINEL_TAG
 from tach.core import ProjectConfig
 
+try:
+    # Prefer the LibYAML bindings when PyYAML was built with them
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader  # type: ignore
+
 
 def dump_project_config_to_yaml(config: ProjectConfig) -> str:
     # Using sort_keys=False here and depending on config.model_dump maintaining 'insertion order'
@@ -24,7 +32,21 @@ def dump_project_config_to_yaml(config: ProjectConfig) -> str:
     # show excluded paths.
     config.exclude = list(set(config.exclude)) if config.exclude else []
     config.exclude.sort()
-    return yaml.dump(config.model_dump(exclude_unset=True), sort_keys=False)
+    return yaml.dump(
+        config.model_dump(exclude_unset=True), Dumper=SafeDumper, sort_keys=False
+    )
+
+
+@lru_cache(maxsize=32)
+def _load_project_config(file_path: Path, mtime_ns: int, size: int) -> ProjectConfig:
+    # mtime and size are only part of the cache key,
+    # so that any change to the file on disk results in a fresh parse
+    with open(file_path) as f:
+        result = yaml.load(f, Loader=SafeLoader)
+        if not result or not isinstance(result, dict):
+            raise ValueError(f"Empty or invalid project config file: {file_path}")
+    config = ProjectConfig(**result)  # type: ignore
+    return config
 
 
 def parse_project_config(root: Path | None = None) -> ProjectConfig | None:
@@ -33,9 +55,10 @@ def parse_project_config(root: Path | None = None) -> ProjectConfig | None:
     if not file_path:
         return None
 
-    with open(file_path) as f:
-        result = yaml.safe_load(f)
-        if not result or not isinstance(result, dict):
-            raise ValueError(f"Empty or invalid project config file: {file_path}")
-    config = ProjectConfig(**result)  # type: ignore
-    return config
+    file_stat = file_path.stat()
+    config = _load_project_config(
+        file_path.resolve(), file_stat.st_mtime_ns, file_stat.st_size
+    )
+    # Callers are free to mutate the config (e.g. during 'sync'),
+    # so the cached instance must never be handed out directly
+    return config.model_copy(deep=True)
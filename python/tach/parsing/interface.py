@@ -1,40 +1,58 @@
 from __future__ import annotations
 
 import ast
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Generator
 
 from tach import filesystem as fs
-from tach.parsing.ast_visitor import EarlyExitNodeVisitor
 
 if TYPE_CHECKING:
     from pathlib import Path
 
 
-class InterfaceVisitor(EarlyExitNodeVisitor):
-    def __init__(self, *args: Any, **kwargs: Any):
-        super().__init__(*args, **kwargs)
-        self.members: list[str] = []
+# The fields of a node which can hold nested statements.
+# Assignments are statements, so expression fields never need to be searched.
+STATEMENT_LIST_FIELDS = ("body", "orelse", "finalbody", "handlers", "cases")
 
-    def visit_Assign(self, node: ast.Assign):
-        # Check if the node is an assignment
+
+# Assignments within these bodies bind local names, not module attributes
+SCOPE_NODE_TYPES = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+
+
+def _iter_statements(parsed_ast: ast.AST) -> Generator[ast.AST, None, None]:
+    # Depth-first over module-level statement lists only, in source order
+    stack: list[ast.AST] = [parsed_ast]
+    while stack:
+        node = stack.pop()
+        yield node
+        if isinstance(node, SCOPE_NODE_TYPES):
+            continue
+        children = [
+            child
+            for field_name in STATEMENT_LIST_FIELDS
+            for child in getattr(node, field_name, ())
+        ]
+        stack.extend(reversed(children))
+
+
+def _get_all_members(parsed_ast: ast.AST) -> list[str]:
+    """
+    Collect the string members of every list assigned to __all__ at module level
+    """
+    members: list[str] = []
+    for node in _iter_statements(parsed_ast):
+        if not isinstance(node, ast.Assign) or not isinstance(node.value, ast.List):
+            continue
         if any(
             isinstance(target, ast.Name) and target.id == "__all__"
             for target in node.targets
         ):
-            # Ensure the value is a list and process each element
-            if isinstance(node.value, ast.List):
-                for element in node.value.elts:
-                    if isinstance(element, ast.Str):  # pyright: ignore
-                        # Supports Python 3.7 and below
-                        self.members.append(element.s)
-                    elif isinstance(element, ast.Constant):
-                        # Supports Python 3.8 and above
-                        if isinstance(element.value, str):
-                            self.members.append(element.value)
-                # Early exit
-                self.set_exit(True)
-        # Continue to the next node
-        self.generic_visit(node)
+            # String literals are always parsed as ast.Constant on Python 3.8+
+            members.extend(
+                element.value
+                for element in node.value.elts
+                if isinstance(element, ast.Constant) and isinstance(element.value, str)
+            )
+    return members
 
 
 def parse_interface_members(source_root: Path, module_path: str) -> list[str]:
@@ -45,7 +63,9 @@ def parse_interface_members(source_root: Path, module_path: str) -> list[str]:
     if file_path is None:
         return []
 
-    parsed_ast = fs.parse_ast(str(file_path))
-    interface_visitor = InterfaceVisitor()
-    interface_visitor.visit(parsed_ast)
-    return interface_visitor.members
+    # Most modules do not declare __all__, and a substring check
+    # is far cheaper than parsing the whole file
+    if "__all__" not in fs.read_file(str(file_path)):
+        return []
+
+    return _get_all_members(fs.parse_ast(str(file_path)))
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections import defaultdict
 from typing import TYPE_CHECKING
 
 from tach import errors
@@ -29,12 +30,16 @@ def sync_dependency_constraints(
         project_config=project_config,
         exclude_paths=exclude_paths,
     )
+    # Many errors share the same source module, so collect the new dependencies
+    # for each module before updating the configuration
+    new_dependencies: defaultdict[str, set[str]] = defaultdict(set)
     for error in check_result.errors:
         error_info = error.error_info
         if error_info.is_dependency_error:
-            project_config.add_dependency_to_module(
-                error_info.source_module, error_info.invalid_module
-            )
+            new_dependencies[error_info.source_module].add(error_info.invalid_module)
+
+    for module, dependencies in new_dependencies.items():
+        project_config.add_dependencies_to_module(module, dependencies)
 
     return project_config
 
@@ -92,6 +97,11 @@ def sync_project(
         )
 
     tach_yml_content = dump_project_config_to_yaml(project_config)
+    # Read the file fresh rather than through the file cache,
+    # since it may have been edited on disk since it was last read
+    if tach_yml_content == tach_yml_path.read_text():
+        # Nothing changed, avoid rewriting the file
+        return
     fs.write_file(str(tach_yml_path), tach_yml_content)
 
 
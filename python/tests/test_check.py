@@ -1,17 +1,27 @@
 from __future__ import annotations
 
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from itertools import chain
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
-from tach.check import check_import, validate_project_modules
+from tach.check import (
+    check,
+    check_import,
+    compile_exclude_patterns,
+    is_path_excluded,
+    validate_project_modules,
+)
 from tach.cli import tach_check
 from tach.core import (
     ModuleConfig,
     ModuleNode,
     ModuleTree,
+    ProjectConfig,
 )
 from tach.core.config import RootModuleConfig
 
@@ -124,6 +134,7 @@ def test_validate_project_modules_root_is_always_valid(tmp_path):
         ("domain_one", "domain_one.subdomain", True),
         ("domain_one", "domain_one.core", True),
         ("domain_one", "domain_three", True),
+        ("domain_three", "domain_three.core", True),
         ("domain_two", "domain_one", True),
         ("domain_two", "domain_one.public_fn", True),
         ("domain_two.subdomain", "domain_one", True),
@@ -148,6 +159,57 @@ def test_check_import(module_tree, file_mod_path, import_mod_path, expected_resu
     assert result == expected_result
 
 
+def test_compile_exclude_patterns():
+    exclude_patterns = compile_exclude_patterns(
+        ["tests", "docs/", ".*__pycache__", "(?i)SRC/SKIP"]
+    )
+    assert exclude_patterns.literal_prefixes == ("tests", "docs/")
+    assert exclude_patterns.combined_regex is not None
+    assert exclude_patterns.combined_regex.pattern == "(?:.*__pycache__)"
+    # Inline global flags cannot be combined, so the pattern is kept on its own
+    assert [pattern.pattern for pattern in exclude_patterns.regexes] == ["(?i)SRC/SKIP"]
+
+
+@pytest.mark.parametrize(
+    "path,expected_result",
+    [
+        ("tests", True),
+        ("tests/unit/test_a.py", True),
+        ("docs", True),
+        ("docsite", False),
+        ("src/__pycache__", True),
+        ("src/skip/mod.py", True),
+        ("src/keep/mod.py", False),
+    ],
+)
+def test_is_path_excluded(path, expected_result):
+    exclude_patterns = compile_exclude_patterns(
+        ["tests", "docs/", ".*__pycache__", "(?i)SRC/SKIP"]
+    )
+    assert is_path_excluded(Path(path), exclude_patterns) == expected_result
+
+
+def test_is_path_excluded_with_repeated_group_names():
+    exclude_patterns = compile_exclude_patterns(["(?P<dir>a)/", "(?P<dir>b)/"])
+    assert is_path_excluded(Path("b"), exclude_patterns)
+    assert not is_path_excluded(Path("c"), exclude_patterns)
+
+
+def test_is_path_excluded_with_backreference():
+    exclude_patterns = compile_exclude_patterns([".*egg-info", r"(\w+)/\1/"])
+    assert is_path_excluded(Path("pkg/pkg"), exclude_patterns)
+    assert not is_path_excluded(Path("pkg/other"), exclude_patterns)
+    assert is_path_excluded(Path("pkg.egg-info"), exclude_patterns)
+
+
+def test_is_path_excluded_with_anchored_patterns():
+    exclude_patterns = compile_exclude_patterns([r".*\.pyi/$", "gen/(?!keep/)"])
+    assert is_path_excluded(Path("stubs/mod.pyi"), exclude_patterns)
+    assert not is_path_excluded(Path("stubs/mod.py"), exclude_patterns)
+    assert is_path_excluded(Path("gen/mod.py"), exclude_patterns)
+    assert not is_path_excluded(Path("gen/keep/mod.py"), exclude_patterns)
+
+
 def test_valid_example_dir(example_dir):
     project_root = example_dir / "valid"
     with pytest.raises(SystemExit) as exc_info:
@@ -160,3 +222,101 @@ def test_valid_example_dir_monorepo(example_dir):
     with pytest.raises(SystemExit) as exc_info:
         tach_check(project_root=project_root)
     assert exc_info.value.code == 0
+
+
+def test_check_skips_excluded_files(tmp_path):
+    for file_path in [
+        "src/mod.py",
+        "src/vendor/lib.py",
+        "src/vendor/nested/lib.py",
+        "src/gen/mod.py",
+        "src/pkg/__pycache__/mod.py",
+        "src/pkg/mod.py",
+    ]:
+        (tmp_path / file_path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / file_path).write_text("")
+
+    checked_files: list[str] = []
+
+    def mock_get_project_imports(file_path: str, **kwargs):
+        checked_files.append(str(Path(file_path).relative_to(tmp_path)))
+        return []
+
+    with patch("tach.check.set_excluded_paths"), patch(
+        "tach.check.get_project_imports", wraps=mock_get_project_imports
+    ):
+        check(
+            project_root=tmp_path,
+            project_config=ProjectConfig(),
+            # 'src/gen/$' only matches the directory itself, never a file within it
+            exclude_paths=["src/vendor", ".*__pycache__", "src/gen/$"],
+        )
+
+    assert set(checked_files) == {
+        str(Path("src/mod.py")),
+        str(Path("src/gen/mod.py")),
+        str(Path("src/pkg/mod.py")),
+    }
+
+
+def test_check_sees_modules_added_between_runs(tmp_path):
+    (tmp_path / "a.py").write_text("import b.extra\n")
+    (tmp_path / "b").mkdir()
+    project_config = ProjectConfig(
+        modules=[ModuleConfig(path="a"), ModuleConfig(path="b")]
+    )
+
+    # 'b.extra' does not exist yet, so it is not a first-party import
+    first_result = check(project_root=tmp_path, project_config=project_config)
+    assert first_result.errors == []
+
+    (tmp_path / "b" / "extra.py").write_text("")
+    second_result = check(project_root=tmp_path, project_config=project_config)
+    assert [
+        (error.import_mod_path, error.error_info.invalid_module)
+        for error in second_result.errors
+    ] == [("b.extra", "b")]
+
+
+def test_check_errors_match_serial_order(tmp_path):
+    file_imports = {
+        "a/one.py": [("b", 1), ("c.core", 2)],
+        "a/two.py": [("b", 3), ("b.inner", 4)],
+        "b/one.py": [("c", 1), ("a", 2)],
+        "b/two.py": [("a.one", 5)],
+        "c/one.py": [("a", 1), ("b", 2), ("a", 3)],
+        "c/core.py": [],
+    }
+    for file_path in file_imports:
+        (tmp_path / file_path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / file_path).write_text("")
+    project_config = ProjectConfig(
+        modules=[
+            ModuleConfig(path="a", depends_on=["c"]),
+            ModuleConfig(path="b"),
+            ModuleConfig(path="c"),
+        ]
+    )
+
+    def mock_get_project_imports(file_path: str, **kwargs):
+        rel_file_path = Path(file_path).relative_to(tmp_path).as_posix()
+        # Finish the earliest walked files last, so that completion order
+        # differs from the order in which the files were submitted
+        time.sleep(0.01 * (len(file_imports) - list(file_imports).index(rel_file_path)))
+        return file_imports[rel_file_path]
+
+    def run_check():
+        with patch("tach.check.set_excluded_paths"), patch(
+            "tach.check.get_project_imports", wraps=mock_get_project_imports
+        ):
+            return check(project_root=tmp_path, project_config=project_config)
+
+    with patch(
+        "tach.check.ThreadPoolExecutor", partial(ThreadPoolExecutor, max_workers=1)
+    ):
+        serial_result = run_check()
+    concurrent_results = [run_check() for _ in range(3)]
+
+    assert len(serial_result.errors) == 9
+    for concurrent_result in concurrent_results:
+        assert concurrent_result.errors == serial_result.errors
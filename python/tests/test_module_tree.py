@@ -116,3 +116,10 @@ def test_find_nearest_in_single_domain(module_tree):
 def test_find_nearest_in_nested_domain(module_tree):
     module = module_tree.find_nearest("domain_two.subdomain.thing")
     assert module.full_path == "domain_two.subdomain"
+
+
+def test_find_nearest_after_insert(test_config):
+    tree = ModuleTree()
+    assert tree.find_nearest("domain.thing") is tree.root
+    tree.insert(test_config, "domain", [])
+    assert tree.find_nearest("domain.thing").full_path == "domain"
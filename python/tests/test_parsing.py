@@ -7,8 +7,8 @@ from pydantic import ValidationError
 
 from tach.constants import ROOT_MODULE_SENTINEL_TAG
 from tach.core import ModuleConfig, ProjectConfig
-from tach.filesystem import file_to_module_path
-from tach.parsing import parse_project_config
+from tach.filesystem import file_to_module_path, relative_file_to_module_path
+from tach.parsing import parse_interface_members, parse_project_config
 
 
 @pytest.fixture
@@ -54,3 +54,69 @@ def test_invalid_project_config(example_dir):
 def test_empty_project_config(example_dir):
     with pytest.raises(ValueError):
         parse_project_config(example_dir / "invalid" / "empty")
+
+
+def test_parse_project_config_returns_fresh_copy(example_dir):
+    first = parse_project_config(example_dir / "valid")
+    second = parse_project_config(example_dir / "valid")
+    assert first == second
+    assert first is not second
+    first.modules.clear()
+    assert parse_project_config(example_dir / "valid") == second
+
+
+def test_parse_project_config_detects_changes(tmp_path):
+    config_path = tmp_path / "tach.yml"
+    config_path.write_text("modules:\n- path: domain_one\n")
+    assert parse_project_config(tmp_path).module_paths == ["domain_one"]
+    config_path.write_text("modules:\n- path: domain_one\n- path: domain_two\n")
+    assert parse_project_config(tmp_path).module_paths == ["domain_one", "domain_two"]
+
+
+def test_parse_interface_members(tmp_path):
+    (tmp_path / "domain").mkdir()
+    (tmp_path / "domain" / "__init__.py").write_text(
+        '__all__ = ["public_fn", "PublicClass", 1]\n'
+    )
+    assert parse_interface_members(tmp_path, "domain") == ["public_fn", "PublicClass"]
+
+
+def test_parse_interface_members_without_all(tmp_path):
+    (tmp_path / "domain.py").write_text("import os\n")
+    assert parse_interface_members(tmp_path, "domain") == []
+
+
+def test_relative_file_to_mod_path():
+    assert relative_file_to_module_path("__init__.py") == ""
+    assert relative_file_to_module_path(".") == ""
+    assert (
+        relative_file_to_module_path(str(Path("domain_one", "__init__.py")))
+        == "domain_one"
+    )
+    assert (
+        relative_file_to_module_path(str(Path("domain_one", "interface.py")))
+        == "domain_one.interface"
+    )
+
+
+def test_parse_interface_members_ignores_nested_scopes(tmp_path):
+    (tmp_path / "domain.py").write_text(
+        "def f():\n"
+        '    __all__ = ["local"]\n'
+        "\n"
+        "if True:\n"
+        '    __all__ = ["public_fn"]\n'
+    )
+    assert parse_interface_members(tmp_path, "domain") == ["public_fn"]
+
+
+def test_parse_interface_members_from_every_branch(tmp_path):
+    (tmp_path / "domain.py").write_text(
+        "try:\n"
+        "    from domain.fast import a\n"
+        '    __all__ = ["a"]\n'
+        "except ImportError:\n"
+        "    from domain.slow import b\n"
+        '    __all__ = ["b"]\n'
+    )
+    assert parse_interface_members(tmp_path, "domain") == ["a", "b"]
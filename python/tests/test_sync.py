@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from unittest.mock import Mock
+
+import pytest
+
+from tach.check import CheckResult
+from tach.core import ModuleConfig, ProjectConfig
+from tach.parsing import dump_project_config_to_yaml
+from tach.sync import sync_project
+
+
+@pytest.fixture
+def mock_check(mocker) -> Mock:
+    mock = Mock(return_value=CheckResult())  # default to a return with no errors
+    mocker.patch("tach.sync.check", mock)
+    return mock
+
+
+def test_sync_rewrites_config_edited_between_syncs(tmp_path, mock_check):
+    project_config = ProjectConfig(modules=[ModuleConfig(path="domain")])
+    expected_content = dump_project_config_to_yaml(project_config.model_copy(deep=True))
+    tach_yml_path = tmp_path / "tach.yml"
+    tach_yml_path.write_text(expected_content)
+
+    sync_project(project_root=tmp_path, project_config=project_config)
+    assert tach_yml_path.read_text() == expected_content
+
+    # Edit the file on disk after it has already been read once in this process
+    tach_yml_path.write_text("modules: []\n")
+    sync_project(project_root=tmp_path, project_config=project_config)
+    assert tach_yml_path.read_text() == expected_content
@@ -1,5 +1,5 @@
 use once_cell::sync::Lazy;
-use regex::{Error, Regex};
+use regex::{Error, RegexSet};
 use std::sync::Mutex;
 
 pub struct PathExclusionError {
@@ -16,9 +16,9 @@ impl From<Error> for PathExclusionError {
     }
 }
 
-#[derive(Default)]
 pub struct PathExclusions {
-    regexes: Vec<Regex>,
+    // A RegexSet matches all patterns in a single scan of the path
+    regex_set: RegexSet,
 }
 
 static PATH_EXCLUSIONS_SINGLETON: Lazy<Mutex<Option<PathExclusions>>> =
@@ -38,23 +38,16 @@ pub fn set_excluded_paths(exclude_paths: Vec<String>) -> Result<()> {
 
 impl PathExclusions {
     fn is_path_excluded(&self, path: &str) -> bool {
-        for re in &self.regexes {
-            if re.is_match(path) {
-                return true;
-            }
-        }
-        false
+        self.regex_set.is_match(path)
     }
 }
 
 impl TryFrom<Vec<String>> for PathExclusions {
     type Error = PathExclusionError;
     fn try_from(value: Vec<String>) -> std::result::Result<Self, Self::Error> {
-        let mut regexes: Vec<Regex> = vec![];
-        for pattern in value.iter() {
-            regexes.push(Regex::new(pattern.as_str())?);
-        }
-        Ok(Self { regexes })
+        Ok(Self {
+            regex_set: RegexSet::new(value)?,
+        })
     }
 }
 
@@ -1,10 +1,12 @@
+use std::collections::HashMap;
 use std::fmt;
 use std::fs;
 use std::io;
-use std::io::Read;
 use std::path::StripPrefixError;
 use std::path::{Path, PathBuf, MAIN_SEPARATOR, MAIN_SEPARATOR_STR};
+use std::sync::Mutex;
 
+use once_cell::sync::Lazy;
 use walkdir::{DirEntry, WalkDir};
 
 use crate::exclusion::is_path_excluded;
@@ -52,30 +54,24 @@ pub fn file_to_module_path(source_root: &str, file_path: &str) -> Result<String>
         return Ok(String::new());
     }
 
-    let module_path = relative_file_path
+    let dotted_path = relative_file_path
         .as_os_str()
         .to_str()
         .unwrap()
         .replace(MAIN_SEPARATOR, ".");
 
-    let mut module_path = if module_path.ends_with(".py") {
-        module_path.trim_end_matches(".py").to_string()
-    } else {
-        module_path
-    };
-
-    if module_path.ends_with(".__init__") {
-        module_path.truncate(module_path.len() - 9);
-    }
+    // Strip suffixes by slicing, and only allocate once for the result
+    let module_path = dotted_path.strip_suffix(".py").unwrap_or(&dotted_path);
+    let module_path = module_path.strip_suffix(".__init__").unwrap_or(module_path);
 
     if module_path == "__init__" {
         return Ok(String::new());
     }
 
-    Ok(module_path)
+    Ok(module_path.to_string())
 }
 
-#[derive(Debug)]
+#[derive(Debug, Clone)]
 pub struct ResolvedModule {
     pub file_path: PathBuf,
     pub member_name: Option<String>,
@@ -141,16 +137,43 @@ pub fn module_to_file_path<P: AsRef<Path>>(root: P, mod_path: &str) -> Option<Re
     None
 }
 
+type ResolvedModuleCache = HashMap<(PathBuf, String), Option<ResolvedModule>>;
+
+// The same mod paths are imported from many files, and resolving each one
+// takes several filesystem probes, so share the results across files
+static RESOLVED_MODULE_CACHE: Lazy<Mutex<ResolvedModuleCache>> =
+    Lazy::new(|| Mutex::new(HashMap::new()));
+
+fn cached_module_to_file_path(root: &Path, mod_path: &str) -> Option<ResolvedModule> {
+    let key = (root.to_path_buf(), mod_path.to_string());
+    if let Ok(cache) = RESOLVED_MODULE_CACHE.lock() {
+        if let Some(resolved_module) = cache.get(&key) {
+            return resolved_module.clone();
+        }
+    }
+
+    // The lock is not held while probing the filesystem
+    let resolved_module = module_to_file_path(root, mod_path);
+    if let Ok(mut cache) = RESOLVED_MODULE_CACHE.lock() {
+        cache.insert(key, resolved_module.clone());
+    }
+    resolved_module
+}
+
+pub fn clear_resolved_module_cache() {
+    // Files may be added or removed between runs in the same process,
+    // so resolved modules are only shared within a single run
+    if let Ok(mut cache) = RESOLVED_MODULE_CACHE.lock() {
+        cache.clear();
+    }
+}
+
 pub fn read_file_content<P: AsRef<Path>>(path: P) -> Result<String> {
-    let mut file = fs::File::open(path.as_ref()).map_err(|_| FileSystemError {
-        message: format!("Could not open path: {}", path.as_ref().display()),
-    })?;
-    let mut content = String::new();
-    file.read_to_string(&mut content)
-        .map_err(|_| FileSystemError {
-            message: format!("Could not read path: {}", path.as_ref().display()),
-        })?;
-    Ok(content)
+    // fs::read_to_string sizes its buffer from the file's metadata up front,
+    // rather than growing an empty String while reading
+    fs::read_to_string(path.as_ref()).map_err(|_| FileSystemError {
+        message: format!("Could not read path: {}", path.as_ref().display()),
+    })
 }
 
 pub fn is_project_import<P: AsRef<Path>>(
@@ -158,7 +181,7 @@ pub fn is_project_import<P: AsRef<Path>>(
     source_root: P,
     mod_path: &str,
 ) -> Result<bool> {
-    let resolved_module = module_to_file_path(source_root, mod_path);
+    let resolved_module = cached_module_to_file_path(source_root.as_ref(), mod_path);
     if let Some(module) = resolved_module {
         // This appears to be a project import, verify it is not excluded
         return match is_path_excluded(
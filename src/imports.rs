@@ -3,6 +3,7 @@ use std::fmt::{self, Debug};
 use std::path::{Path, PathBuf};
 
 use pyo3::conversion::IntoPy;
+use pyo3::types::PyString;
 use pyo3::PyObject;
 
 use once_cell::sync::Lazy;
@@ -44,32 +45,45 @@ pub type ProjectImports = Vec<ProjectImport>;
 
 impl IntoPy<PyObject> for ProjectImport {
     fn into_py(self, py: pyo3::prelude::Python<'_>) -> PyObject {
-        (self.mod_path, self.line_no).into_py(py)
+        // The same mod paths are imported from many files, so hand Python interned strings.
+        // Repeated paths then share one object, and dict lookups on them hit by identity.
+        (PyString::intern(py, &self.mod_path), self.line_no).into_py(py)
     }
 }
 
 pub type IgnoreDirectives = HashMap<usize, Vec<String>>;
 
 static TACH_IGNORE_REGEX: Lazy<regex::Regex> =
-    Lazy::new(|| Regex::new(r"# *tach-ignore(( [\w.]+)*)$").unwrap());
+    Lazy::new(|| Regex::new(r"(?mR)# *tach-ignore(( [\w.]+)*)$").unwrap());
 
 fn get_ignore_directives(file_content: &str) -> IgnoreDirectives {
     let mut ignores: IgnoreDirectives = HashMap::new();
 
-    for (lineno, line) in file_content.lines().enumerate() {
-        let normal_lineno = lineno + 1;
-        if let Some(captures) = TACH_IGNORE_REGEX.captures(line) {
-            let ignored_modules = captures.get(1).map_or("", |m| m.as_str());
-            let modules: Vec<String> = if ignored_modules.is_empty() {
-                Vec::new()
-            } else {
-                ignored_modules
-                    .split_whitespace()
-                    .map(String::from)
-                    .collect()
-            };
-            ignores.insert(normal_lineno, modules);
-        }
+    if !file_content.contains("tach-ignore") {
+        // Most files have no directives, and a single substring search
+        // is much cheaper than running the regex over the file
+        return ignores;
+    }
+
+    // Run the multi-line regex once over the whole file, counting newlines
+    // between matches to track line numbers instead of splitting into lines
+    let mut lineno = 1;
+    let mut last_offset = 0;
+    for captures in TACH_IGNORE_REGEX.captures_iter(file_content) {
+        let match_start = captures.get(0).unwrap().start();
+        lineno += file_content[last_offset..match_start].matches('\n').count();
+        last_offset = match_start;
+
+        let ignored_modules = captures.get(1).map_or("", |m| m.as_str());
+        let modules: Vec<String> = if ignored_modules.is_empty() {
+            Vec::new()
+        } else {
+            ignored_modules
+                .split_whitespace()
+                .map(String::from)
+                .collect()
+        };
+        ignores.insert(lineno, modules);
     }
 
     ignores
@@ -97,9 +111,13 @@ impl<'a> AsProjectImports<'a> for StmtImport {
         _is_package: bool,
         ignore_directives: &IgnoreDirectives,
     ) -> ProjectImports {
-        let line_no = locator.compute_line_index(self.range.start()).get();
-        let ignored_modules: Option<&Vec<String>> =
-            ignore_directives.get(&line_no.saturating_sub(1));
+        // Most files have no directives, so avoid computing the line number at all
+        let ignored_modules: Option<&Vec<String>> = if ignore_directives.is_empty() {
+            None
+        } else {
+            let line_no = locator.compute_line_index(self.range.start()).get();
+            ignore_directives.get(&line_no.saturating_sub(1))
+        };
 
         if let Some(ignored) = ignored_modules {
             if ignored.is_empty() {
@@ -159,20 +177,19 @@ impl<'a> AsProjectImports<'a> for StmtImportFrom {
                     import_depth
                 };
 
-                let base_path_parts: Vec<&str> = file_mod_path.split('.').collect();
-                let base_path_parts = if num_paths_to_strip > 0 {
-                    base_path_parts[..base_path_parts.len() - num_paths_to_strip].to_vec()
-                } else {
-                    base_path_parts
-                };
+                // Strip trailing segments by slicing the file's mod path in place,
+                // rather than splitting it into a Vec and joining it back together
+                let mut base_path: Option<&str> = Some(file_mod_path);
+                for _ in 0..num_paths_to_strip {
+                    base_path = base_path.and_then(|path| path.rfind('.').map(|idx| &path[..idx]));
+                }
 
-                if base_path_parts.is_empty() {
-                    module.to_string()
-                } else {
+                match base_path {
                     // base_mod_path is the current file's mod path
                     // minus the paths_to_strip (due to level of import)
                     // plus the module we are importing from
-                    format!("{}.{}", base_path_parts.join("."), module)
+                    Some(base_path) => format!("{}.{}", base_path, module),
+                    None => module.to_string(),
                 }
             } else {
                 module.to_string()
@@ -182,9 +199,13 @@ impl<'a> AsProjectImports<'a> for StmtImportFrom {
             String::new()
         };
 
-        let line_no = locator.compute_line_index(self.range.start()).get();
-        let ignored_modules: Option<&Vec<String>> =
-            ignore_directives.get(&line_no.saturating_sub(1));
+        // Most files have no directives, so avoid computing the line number at all
+        let ignored_modules: Option<&Vec<String>> = if ignore_directives.is_empty() {
+            None
+        } else {
+            let line_no = locator.compute_line_index(self.range.start()).get();
+            ignore_directives.get(&line_no.saturating_sub(1))
+        };
 
         if let Some(ignored) = ignored_modules {
             if ignored.is_empty() {
@@ -194,23 +215,34 @@ impl<'a> AsProjectImports<'a> for StmtImportFrom {
             }
         }
 
-        for name in &self.names {
-            let local_mod_path = format!(
-                "{}{}.{}",
+        // Only build local mod paths when there is a directive to match them against
+        let local_mod_path_prefix = ignored_modules.map(|_| {
+            format!(
+                "{}{}.",
                 ".".repeat(import_depth),
-                self.module.as_deref().unwrap_or(""),
-                name.asname.as_deref().unwrap_or(name.name.as_ref())
-            );
-            if let Some(ignored) = ignored_modules {
+                self.module.as_deref().unwrap_or("")
+            )
+        });
+        // Every name shares this prefix, so format it once per statement
+        // and join each name onto it with a single allocation
+        let global_mod_path_prefix = match self.module {
+            Some(_) => format!("{}.", base_mod_path),
+            None => String::new(),
+        };
+
+        for name in &self.names {
+            if let (Some(ignored), Some(prefix)) = (ignored_modules, &local_mod_path_prefix) {
+                let local_mod_path = [
+                    prefix.as_str(),
+                    name.asname.as_deref().unwrap_or(name.name.as_ref()),
+                ]
+                .concat();
                 if ignored.contains(&local_mod_path) {
                     continue; // This import is ignored by a directive
                 }
             }
 
-            let global_mod_path = match self.module {
-                Some(_) => format!("{}.{}", base_mod_path, name.name.as_str()),
-                None => name.name.to_string(),
-            };
+            let global_mod_path = [global_mod_path_prefix.as_str(), name.name.as_str()].concat();
 
             match filesystem::is_project_import(
                 project_root.as_ref(),
@@ -269,11 +301,15 @@ impl<'a> ImportVisitor<'a> {
     }
 
     fn should_ignore_if_statement(&mut self, node: &StmtIf) -> bool {
-        let id = match node.test.as_ref() {
-            Expr::Name(ref name) => Some(name.id.as_str()),
-            _ => None,
-        };
-        id.unwrap_or_default() == "TYPE_CHECKING" && self.ignore_type_checking_imports
+        // Check the flag first, so that no 'if' statements are inspected
+        // when TYPE_CHECKING imports are being kept
+        if !self.ignore_type_checking_imports {
+            return false;
+        }
+        match node.test.as_ref() {
+            Expr::Name(ref name) => name.id.as_str() == "TYPE_CHECKING",
+            _ => false,
+        }
     }
 
     fn visit_stmt_import(&mut self, node: &StmtImport) {
@@ -336,6 +372,12 @@ pub fn get_project_imports(
                 err
             ),
         })?;
+    if !file_contents.contains("import") {
+        // A file without the keyword cannot contain any import statements,
+        // so skip scanning for directives and visiting the AST.
+        // This comes after parsing so that syntax errors are still reported.
+        return Ok(ProjectImports::new());
+    }
     let is_package = file_path.ends_with("__init__.py");
     let ignore_directives = get_ignore_directives(file_contents.as_str());
     let locator = Locator::new(&file_contents);
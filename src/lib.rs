@@ -34,17 +34,22 @@ impl From<reports::ReportCreationError> for PyErr {
 #[pyfunction]
 #[pyo3(signature = (project_root, source_root, file_path, ignore_type_checking_imports=false))]
 fn get_project_imports(
+    py: Python<'_>,
     project_root: String,
     source_root: String,
     file_path: String,
     ignore_type_checking_imports: bool,
 ) -> imports::Result<imports::ProjectImports> {
-    imports::get_project_imports(
-        project_root,
-        source_root,
-        file_path,
-        ignore_type_checking_imports,
-    )
+    // Reading and parsing the file does not touch Python objects,
+    // so release the GIL to let callers gather imports from several threads
+    py.allow_threads(|| {
+        imports::get_project_imports(
+            project_root,
+            source_root,
+            file_path,
+            ignore_type_checking_imports,
+        )
+    })
 }
 
 /// Set excluded paths globally.
@@ -53,6 +58,9 @@ fn get_project_imports(
 #[pyfunction]
 #[pyo3(signature = (exclude_paths))]
 fn set_excluded_paths(exclude_paths: Vec<String>) -> exclusion::Result<()> {
+    // This is called once at the start of every run,
+    // so it also marks the start of a fresh module resolution cache
+    filesystem::clear_resolved_module_cache();
     exclusion::set_excluded_paths(exclude_paths)
 }
 